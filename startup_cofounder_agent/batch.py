@@ -0,0 +1,207 @@
+"""Bulk generation of deliverables for many business ideas at once.
+
+The single-idea workflow ("generate four texts, then build a .pptx") is
+embarrassingly parallel across ideas: the API calls are network-bound and
+the deck build is CPU-bound. This module spreads ideas across a
+``ProcessPoolExecutor`` so the python-pptx work scales with cores, while
+each worker issues its four OpenAI calls concurrently with ``asyncio``.
+Total in-flight requests are therefore at most four per worker process;
+cap ``max_workers`` if that exceeds your account's rate limits.
+
+Example usage:
+
+.. code-block:: bash
+
+    python -m startup_cofounder_agent.batch ideas.txt --output-dir ./outputs
+
+where ``ideas.txt`` contains one business idea per line. Each idea gets
+its own subdirectory of the output directory, named after a slug of the
+idea text.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, List
+
+from . import generator, ppt_generator, semantic_cache
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+def _slugify(idea: str) -> str:
+    """Turn an idea into a short filesystem-safe directory name."""
+    slug = _SLUG_RE.sub("-", idea.lower()).strip("-")
+    return slug[:60] or "idea"
+
+
+def build_deck(
+    idea: str,
+    output_dir: str,
+    *,
+    api_key: str | None = None,
+    model: str | None = None,
+    use_cache: bool = True,
+) -> Path:
+    """Generate all four deliverables for one idea and build its pitch deck.
+
+    The four prompts are issued concurrently, so each call of this
+    function keeps at most four requests in flight.
+
+    Args:
+        idea: A short description of the startup concept.
+        output_dir: Directory under which a per-idea subdirectory is created.
+        api_key: Optional OpenAI API key.
+        model: Optional model override (default: ``generator.DEFAULT_MODEL``).
+        use_cache: Whether to consult and populate the on-disk cache.
+
+    Returns:
+        The per-idea output directory containing the four deliverables.
+    """
+    idea_dir = Path(output_dir).expanduser().resolve() / _slugify(idea)
+    idea_dir.mkdir(parents=True, exist_ok=True)
+
+    # A semantically similar idea may already have a full deliverable set
+    # cached; reusing it skips all four completion calls.
+    cached = semantic_cache.lookup(idea, api_key=api_key) if use_cache else None
+    if cached is not None:
+        (idea_dir / "market_analysis.txt").write_text(cached["market_analysis"], encoding="utf-8")
+        (idea_dir / "pricing_tiers.txt").write_text(cached["pricing_tiers"], encoding="utf-8")
+        (idea_dir / "landing_page.txt").write_text(cached["landing_page"], encoding="utf-8")
+        ppt_generator.create_pitch_deck(cached["slides"], str(idea_dir / "pitch_deck.pptx"))
+        return idea_dir
+
+    async def _generate_all():
+        def _call(agenerate):
+            return agenerate(idea, api_key=api_key, model=model, use_cache=use_cache)
+
+        return await asyncio.gather(
+            _call(generator.agenerate_market_analysis),
+            _call(generator.agenerate_pricing_tiers),
+            _call(generator.agenerate_landing_page_copy),
+            _call(generator.agenerate_pitch_deck_outline),
+        )
+
+    market_analysis, pricing_tiers, landing_page, slides = asyncio.run(_generate_all())
+    (idea_dir / "market_analysis.txt").write_text(market_analysis, encoding="utf-8")
+    (idea_dir / "pricing_tiers.txt").write_text(pricing_tiers, encoding="utf-8")
+    (idea_dir / "landing_page.txt").write_text(landing_page, encoding="utf-8")
+    ppt_generator.create_pitch_deck(slides, str(idea_dir / "pitch_deck.pptx"))
+    if use_cache:
+        semantic_cache.store(
+            idea,
+            {
+                "market_analysis": market_analysis,
+                "pricing_tiers": pricing_tiers,
+                "landing_page": landing_page,
+                "slides": slides,
+            },
+            api_key=api_key,
+        )
+    return idea_dir
+
+
+def run_batch(
+    ideas: Iterable[str],
+    output_dir: str = ".",
+    *,
+    api_key: str | None = None,
+    model: str | None = None,
+    use_cache: bool = True,
+    max_workers: int | None = None,
+) -> List[Path]:
+    """Generate deliverable sets for many ideas across a process pool.
+
+    Args:
+        ideas: Business idea descriptions; blank entries are skipped.
+        output_dir: Directory under which per-idea subdirectories are created.
+        api_key: Optional OpenAI API key.
+        model: Optional model override (default: ``generator.DEFAULT_MODEL``).
+        use_cache: Whether to consult and populate the on-disk cache.
+        max_workers: Worker process count (default: the CPU count, capped
+            at the number of ideas).
+
+    Returns:
+        The per-idea output directories, in input order.
+
+    Raises:
+        ValueError: If no non-blank ideas are provided.
+    """
+    cleaned = [idea.strip() for idea in ideas if idea.strip()]
+    if not cleaned:
+        raise ValueError("No ideas provided to run_batch().")
+    workers = max_workers or min(len(cleaned), os.cpu_count() or 1)
+    build = functools.partial(
+        build_deck, output_dir=output_dir, api_key=api_key, model=model, use_cache=use_cache
+    )
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(build, cleaned))
+
+
+def parse_args() -> argparse.Namespace:
+    """Define and parse command line arguments.
+
+    Returns:
+        Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Generate deliverables for many startup ideas listed in a file, one per line."
+    )
+    parser.add_argument(
+        "ideas_file",
+        help="Path to a text file containing one business idea per line.",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=".",
+        help="Directory where per-idea output directories will be created (default: current working directory).",
+    )
+    parser.add_argument(
+        "--api-key",
+        default=None,
+        help="Explicit OpenAI API key. If omitted, the OPENAI_API_KEY environment variable is used.",
+    )
+    parser.add_argument(
+        "--model",
+        default=None,
+        help="OpenAI model to use (default: the SCA_MODEL environment variable, falling back to gpt-4o-mini).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk response cache and always call the OpenAI API.",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count, capped at the number of ideas).",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Entry point for bulk generation from a file of ideas."""
+    args = parse_args()
+    ideas = Path(args.ideas_file).read_text(encoding="utf-8").splitlines()
+    print(f"Generating deliverables for {sum(1 for i in ideas if i.strip())} ideas...")
+    results = run_batch(
+        ideas,
+        args.output_dir,
+        api_key=args.api_key,
+        model=args.model,
+        use_cache=not args.no_cache,
+        max_workers=args.max_workers,
+    )
+    for idea_dir in results:
+        print(f"✔ Deliverables written to {idea_dir}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -25,10 +25,11 @@ If the API key is not provided as a flag, it must be available in the
 from __future__ import annotations
 
 import argparse
+import asyncio
 import os
 from pathlib import Path
 
-from . import generator, ppt_generator
+from . import generator, ppt_generator, semantic_cache
 
 
 def parse_args() -> argparse.Namespace:
@@ -54,6 +55,24 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Explicit OpenAI API key. If omitted, the OPENAI_API_KEY environment variable is used.",
     )
+    parser.add_argument(
+        "--model",
+        default=None,
+        help="OpenAI model to use (default: the SCA_MODEL environment variable, falling back to gpt-4o-mini).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk response cache and always call the OpenAI API.",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help=(
+            "Submit all prompts through the OpenAI Batch API (50%% cheaper, but "
+            "turnaround may take minutes to hours)."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -68,27 +87,113 @@ def main() -> None:
     idea: str = args.idea
     output_dir = Path(args.output_dir).expanduser().resolve()
     api_key = args.api_key
+    model = args.model
+    use_cache = not args.no_cache
     # Ensure output directory exists
     output_dir.mkdir(parents=True, exist_ok=True)
-    # Generate content
-    print("Generating market analysis...")
-    market_analysis = generator.generate_market_analysis(idea, api_key=api_key)
-    print("Generating pricing tiers...")
-    pricing_tiers = generator.generate_pricing_tiers(idea, api_key=api_key)
-    print("Generating landing page copy...")
-    landing_page = generator.generate_landing_page_copy(idea, api_key=api_key)
-    print("Generating pitch deck outline...")
-    slides = generator.generate_pitch_deck_outline(idea, api_key=api_key)
-    # Write outputs
     analysis_path = output_dir / "market_analysis.txt"
     pricing_path = output_dir / "pricing_tiers.txt"
     landing_path = output_dir / "landing_page.txt"
     deck_path = output_dir / "pitch_deck.pptx"
-    analysis_path.write_text(market_analysis, encoding="utf-8")
-    pricing_path.write_text(pricing_tiers, encoding="utf-8")
-    landing_path.write_text(landing_page, encoding="utf-8")
-    # Create the PowerPoint
-    ppt_generator.create_pitch_deck(slides, str(deck_path))
+    # Generate content. The four prompts are independent, so they are issued
+    # concurrently: total wall time is roughly the slowest call rather than
+    # the sum of four network round-trips. With --batch they are submitted
+    # as one Batch API job instead, trading turnaround time for cost.
+    # A semantically similar idea may already have a full deliverable set
+    # cached; reusing it skips all four completion calls.
+    cached = semantic_cache.lookup(idea, api_key=api_key) if use_cache else None
+    if cached is not None:
+        print("Found a semantically similar idea in the cache; reusing its deliverables...")
+        analysis_path.write_text(cached["market_analysis"], encoding="utf-8")
+        pricing_path.write_text(cached["pricing_tiers"], encoding="utf-8")
+        landing_path.write_text(cached["landing_page"], encoding="utf-8")
+        ppt_generator.create_pitch_deck(cached["slides"], str(deck_path))
+    elif args.batch:
+        print("Generating market analysis, pricing tiers, landing page copy and pitch deck outline...")
+        print("Submitting prompts via the OpenAI Batch API; this may take a while...")
+        replies = generator.submit_batch(
+            {
+                "market": generator._market_analysis_prompt(idea),
+                "pricing": generator._pricing_tiers_prompt(idea),
+                "landing": generator._landing_page_prompt(idea),
+                "deck": generator._pitch_deck_prompt(idea),
+            },
+            api_key=api_key,
+            model=model or generator.DEFAULT_MODEL,
+            use_cache=use_cache,
+        )
+        slides = generator._parse_pitch_deck_outline(replies["deck"])
+
+        # Issue the three text writes and the deck build concurrently so a
+        # slow filesystem (NFS, cloud mounts) pays one round of fsyncs, not
+        # four in sequence.
+        async def _write_all():
+            await asyncio.gather(
+                asyncio.to_thread(analysis_path.write_text, replies["market"], "utf-8"),
+                asyncio.to_thread(pricing_path.write_text, replies["pricing"], "utf-8"),
+                asyncio.to_thread(landing_path.write_text, replies["landing"], "utf-8"),
+                asyncio.to_thread(ppt_generator.create_pitch_deck, slides, str(deck_path)),
+            )
+
+        asyncio.run(_write_all())
+        if use_cache:
+            semantic_cache.store(
+                idea,
+                {
+                    "market_analysis": replies["market"],
+                    "pricing_tiers": replies["pricing"],
+                    "landing_page": replies["landing"],
+                    "slides": slides,
+                },
+                api_key=api_key,
+            )
+    else:
+        print("Generating market analysis, pricing tiers, landing page copy and pitch deck outline...")
+        # The three text deliverables stream straight into their output
+        # files as tokens arrive, so the files fill up during generation
+        # instead of after it. The pitch deck outline is collected whole
+        # because it has to be parsed before the .pptx can be built.
+        with (
+            open(analysis_path, "w", encoding="utf-8") as analysis_file,
+            open(pricing_path, "w", encoding="utf-8") as pricing_file,
+            open(landing_path, "w", encoding="utf-8") as landing_file,
+        ):
+
+            async def _generate_deck():
+                slides = await generator.agenerate_pitch_deck_outline(
+                    idea, api_key=api_key, model=model, use_cache=use_cache
+                )
+                # Build the .pptx as soon as its outline is ready, so the
+                # CPU-bound deck build overlaps any still-running generations.
+                await asyncio.to_thread(ppt_generator.create_pitch_deck, slides, str(deck_path))
+                return slides
+
+            async def _generate_all():
+                return await asyncio.gather(
+                    generator.agenerate_market_analysis(
+                        idea, api_key=api_key, model=model, use_cache=use_cache, sink=analysis_file.write
+                    ),
+                    generator.agenerate_pricing_tiers(
+                        idea, api_key=api_key, model=model, use_cache=use_cache, sink=pricing_file.write
+                    ),
+                    generator.agenerate_landing_page_copy(
+                        idea, api_key=api_key, model=model, use_cache=use_cache, sink=landing_file.write
+                    ),
+                    _generate_deck(),
+                )
+
+            market_analysis, pricing_tiers, landing_page, slides = asyncio.run(_generate_all())
+        if use_cache:
+            semantic_cache.store(
+                idea,
+                {
+                    "market_analysis": market_analysis,
+                    "pricing_tiers": pricing_tiers,
+                    "landing_page": landing_page,
+                    "slides": slides,
+                },
+                api_key=api_key,
+            )
     # Print summary
     print(f"\n✔ Market analysis written to {analysis_path}")
     print(f"✔ Pricing tiers written to {pricing_path}")
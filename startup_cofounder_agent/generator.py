@@ -12,6 +12,11 @@ OpenAI API key. If no API key is provided, the key is read from
 the ``OPENAI_API_KEY`` environment variable. Each function returns
 raw strings; the CLI transforms these into files.
 
+Each generator also has an async sibling prefixed with ``a`` (e.g.
+``agenerate_market_analysis``) so that independent prompts can be issued
+concurrently with ``asyncio.gather`` instead of waiting on four network
+round‑trips in sequence.
+
 Note: This module does not attempt to parse or validate the OpenAI
 response beyond returning the generated text. For production usage
 you may wish to add more robust parsing.
@@ -19,19 +24,88 @@ you may wish to add more robust parsing.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import json
 import os
-from typing import List, Dict, Tuple
+import random
+import re
+import string
+import time
+from pathlib import Path
+from typing import Callable, List, Dict, Tuple
 
 try:
     import openai  # type: ignore
 except ImportError:
     openai = None  # OpenAI is optional; the user must install it separately.
 
-DEFAULT_MODEL = "gpt-4"
+# Overridable via the SCA_MODEL environment variable or the model= kwarg
+# (--model on the CLI). gpt-4o-mini is several times faster and far
+# cheaper than the old gpt-4 default with comparable business copy.
+DEFAULT_MODEL = os.environ.get("SCA_MODEL", "gpt-4o-mini")
+_TEMPERATURE = 0.7
+
+# One shared system message referenced (never rebuilt) by every call path,
+# including batches. Keeping the prefix byte-identical across requests lets
+# OpenAI's server-side prompt-prefix cache discount the repeated tokens.
+_SYSTEM_MSG = {"role": "system", "content": "You are an expert startup consultant."}
+
+# Responses are cached on disk keyed by a hash of (model, prompt, temperature),
+# so re-running the same idea returns instantly at zero token cost. The cache
+# can be bypassed per call with ``use_cache=False`` (``--no-cache`` on the CLI).
+_CACHE_DIR = Path.home() / ".cache" / "startup_cofounder_agent"
+_CACHE_MAX_ENTRIES = 256
+
+
+def _cache_key(prompt: str, model: str) -> str:
+    """Compute the content-addressed cache key for a prompt/model pair."""
+    payload = json.dumps(
+        {"model": model, "prompt": prompt, "temperature": _TEMPERATURE},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cache_get(key: str) -> str | None:
+    """Return the cached response for ``key``, or ``None`` on a miss."""
+    path = _CACHE_DIR / f"{key}.txt"
+    try:
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _cache_put(key: str, text: str) -> None:
+    """Store a response under ``key``, evicting the oldest entries if needed.
+
+    Cache failures are deliberately swallowed: a read-only home directory or
+    full disk should never break generation.
+    """
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (_CACHE_DIR / f"{key}.txt").write_text(text, encoding="utf-8")
+        entries = sorted(_CACHE_DIR.glob("*.txt"), key=lambda p: p.stat().st_mtime)
+        for stale in entries[: max(0, len(entries) - _CACHE_MAX_ENTRIES)]:
+            stale.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def _client_for(key: str):
+    """Build an ``openai.OpenAI`` client for the given key, cached at module scope.
+
+    Reusing one client lets all requests in a process share the underlying
+    keep-alive connection pool instead of paying a fresh TCP and TLS
+    handshake (~100–300 ms) per call.
+    """
+    return openai.OpenAI(api_key=key)
 
 
-def _ensure_openai(api_key: str | None) -> None:
-    """Ensure the OpenAI package is available and the API key is set.
+def _get_client(api_key: str | None):
+    """Return the shared OpenAI client, validating the package and API key.
 
     Args:
         api_key: An explicit API key or ``None`` to read from the
@@ -50,19 +124,114 @@ def _ensure_openai(api_key: str | None) -> None:
         raise RuntimeError(
             "No OpenAI API key was provided. Set the OPENAI_API_KEY environment variable or pass api_key explicitly."
         )
-    openai.api_key = key
+    return _client_for(key)
+
+
+_MAX_ATTEMPTS = 6
+_BACKOFF_MAX_SECONDS = 30.0
+
+
+def _retryable_exceptions() -> tuple:
+    """Exception types worth retrying: rate limits, dropped connections, timeouts."""
+    if openai is None:
+        return ()
+    return tuple(
+        exc
+        for exc in (
+            getattr(openai, "RateLimitError", None),
+            getattr(openai, "APIConnectionError", None),
+            getattr(openai, "APITimeoutError", None),
+            getattr(openai, "InternalServerError", None),
+        )
+        if exc is not None
+    )
+
+
+def _with_retries(func):
+    """Retry transient OpenAI failures with exponential backoff and jitter.
+
+    A single 429 or dropped connection used to fail the whole run, forcing
+    the user to re-pay for the calls that had already succeeded. Transient
+    errors are now retried up to ``_MAX_ATTEMPTS`` times, sleeping a random
+    1 to min(2**attempt, 30) seconds between tries; all other errors
+    propagate immediately.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        retryable = _retryable_exceptions()
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            try:
+                return func(*args, **kwargs)
+            except retryable:
+                if attempt == _MAX_ATTEMPTS:
+                    raise
+                time.sleep(random.uniform(1.0, min(2.0 ** attempt, _BACKOFF_MAX_SECONDS)))
+
+    return wrapper
 
 
-def _chat_completion(prompt: str, api_key: str | None = None, model: str = DEFAULT_MODEL) -> str:
+@_with_retries
+def _create_completion(client, **kwargs):
+    """Issue one ``chat.completions.create`` call, retrying transient failures."""
+    return client.chat.completions.create(**kwargs)
+
+
+def _rejects_response_format(exc: Exception) -> bool:
+    """Return whether an API error means the model rejected ``response_format``.
+
+    JSON mode arrived with the 1106 model generation; older models reject
+    the parameter with a 400 invalid-parameter error. Detecting the
+    rejection at call time covers every such model, unlike a hardcoded
+    list of legacy names.
+    """
+    bad_request = getattr(openai, "BadRequestError", None) if openai is not None else None
+    if bad_request is None or not isinstance(exc, bad_request):
+        return False
+    return "response_format" in str(exc)
+
+
+def _create_completion_compat(client, response_format=None, **kwargs):
+    """Create a completion, dropping ``response_format`` if the model rejects it.
+
+    The outline parser has a line-oriented fallback, so withholding JSON
+    mode from a model that cannot do it beats failing the whole run.
+    """
+    if response_format is None:
+        return _create_completion(client, **kwargs)
+    try:
+        return _create_completion(client, response_format=response_format, **kwargs)
+    except Exception as exc:
+        if not _rejects_response_format(exc):
+            raise
+        return _create_completion(client, **kwargs)
+
+
+def _chat_completion(
+    prompt: str,
+    api_key: str | None = None,
+    model: str = DEFAULT_MODEL,
+    use_cache: bool = True,
+    response_format: Dict[str, str] | None = None,
+    sink: Callable[[str], None] | None = None,
+) -> str:
     """Send a prompt to the OpenAI ChatCompletion endpoint and return the result.
 
     This helper hides API boilerplate and centralises the error handling.
+    Responses are cached on disk keyed by (model, prompt, temperature), so
+    identical prompts are served from ``~/.cache/startup_cofounder_agent``
+    without a network call.
 
     Args:
         prompt: The text prompt to send to the model.
         api_key: Optional API key; if omitted the ``OPENAI_API_KEY``
             environment variable is used.
-        model: The OpenAI model name (default: ``gpt‑4``).
+        model: The OpenAI model name (default: :data:`DEFAULT_MODEL`).
+        use_cache: Whether to consult and populate the on-disk cache.
+        response_format: Optional ``response_format`` payload, e.g.
+            ``{"type": "json_object"}`` to force structured output.
+        sink: Optional callable receiving text incrementally; when given,
+            the completion is streamed (see :func:`_chat_completion_stream`).
 
     Returns:
         The content of the assistant's reply as a string.
@@ -70,26 +239,276 @@ def _chat_completion(prompt: str, api_key: str | None = None, model: str = DEFAU
     Raises:
         RuntimeError: If the OpenAI API is unavailable or fails.
     """
-    _ensure_openai(api_key)
+    if sink is not None:
+        return _chat_completion_stream(
+            prompt,
+            sink,
+            api_key=api_key,
+            model=model,
+            use_cache=use_cache,
+            response_format=response_format,
+        )
+    key = _cache_key(prompt, model)
+    if use_cache:
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+    client = _get_client(api_key)
     try:
-        completion = openai.ChatCompletion.create(
+        completion = _create_completion_compat(
+            client,
+            response_format=response_format,
             model=model,
             messages=[
-                {"role": "system", "content": "You are an expert startup consultant."},
+                _SYSTEM_MSG,
                 {"role": "user", "content": prompt},
             ],
-            temperature=0.7,
+            temperature=_TEMPERATURE,
         )
     except Exception as exc:  # Catch broad exceptions to surface them nicely
         raise RuntimeError(f"Failed to call OpenAI API: {exc}") from exc
     # Extract the assistant reply
     try:
-        return completion["choices"][0]["message"]["content"].strip()
+        result = completion.choices[0].message.content.strip()
     except Exception as exc:
         raise RuntimeError(f"Unexpected response format from OpenAI API: {exc}") from exc
+    if use_cache:
+        _cache_put(key, result)
+    return result
+
+
+def _chat_completion_stream(
+    prompt: str,
+    sink: Callable[[str], None],
+    api_key: str | None = None,
+    model: str = DEFAULT_MODEL,
+    use_cache: bool = True,
+    response_format: Dict[str, str] | None = None,
+) -> str:
+    """Stream a completion, feeding each chunk to ``sink`` as it arrives.
+
+    Writing tokens straight to their destination (typically an open output
+    file) turns N seconds of silence into text appearing as it is
+    generated, and keeps peak memory at a few KB instead of the full
+    response. On a cache hit, the cached text is passed to ``sink`` whole.
+
+    Args:
+        prompt: The text prompt to send to the model.
+        sink: Callable invoked with each text fragment, e.g. ``file.write``.
+        api_key: Optional API key; if omitted the ``OPENAI_API_KEY``
+            environment variable is used.
+        model: The OpenAI model name (default: :data:`DEFAULT_MODEL`).
+        use_cache: Whether to consult and populate the on-disk cache.
+        response_format: Optional ``response_format`` payload for the API.
+
+    Returns:
+        The full content of the assistant's reply as a string.
+
+    Raises:
+        RuntimeError: If the OpenAI API is unavailable or fails.
+    """
+    key = _cache_key(prompt, model)
+    if use_cache:
+        cached = _cache_get(key)
+        if cached is not None:
+            sink(cached)
+            return cached
+    client = _get_client(api_key)
+    parts: List[str] = []
+    try:
+        # The rejection, if any, surfaces when the stream is created, so
+        # nothing has reached ``sink`` yet when the retry happens.
+        stream = _create_completion_compat(
+            client,
+            response_format=response_format,
+            model=model,
+            messages=[
+                _SYSTEM_MSG,
+                {"role": "user", "content": prompt},
+            ],
+            temperature=_TEMPERATURE,
+            stream=True,
+        )
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                sink(delta)
+                parts.append(delta)
+    except Exception as exc:  # Catch broad exceptions to surface them nicely
+        raise RuntimeError(f"Failed to call OpenAI API: {exc}") from exc
+    result = "".join(parts).strip()
+    if use_cache:
+        _cache_put(key, result)
+    return result
+
+
+async def _achat_completion(
+    prompt: str,
+    api_key: str | None = None,
+    model: str = DEFAULT_MODEL,
+    use_cache: bool = True,
+    response_format: Dict[str, str] | None = None,
+    sink: Callable[[str], None] | None = None,
+) -> str:
+    """Async variant of :func:`_chat_completion`.
+
+    The blocking API call is dispatched to a worker thread via
+    ``asyncio.to_thread`` so that several completions can be awaited
+    concurrently without tying up the event loop.
+
+    Args:
+        prompt: The text prompt to send to the model.
+        api_key: Optional API key; if omitted the ``OPENAI_API_KEY``
+            environment variable is used.
+        model: The OpenAI model name (default: :data:`DEFAULT_MODEL`).
+        use_cache: Whether to consult and populate the on-disk cache.
+        response_format: Optional ``response_format`` payload for the API.
+        sink: Optional callable receiving text incrementally as it streams.
 
+    Returns:
+        The content of the assistant's reply as a string.
+    """
+    return await asyncio.to_thread(
+        _chat_completion,
+        prompt,
+        api_key=api_key,
+        model=model,
+        use_cache=use_cache,
+        response_format=response_format,
+        sink=sink,
+    )
 
-def generate_market_analysis(idea: str, *, api_key: str | None = None) -> str:
+
+def submit_batch(
+    prompts: Dict[str, str],
+    *,
+    api_key: str | None = None,
+    model: str = DEFAULT_MODEL,
+    use_cache: bool = True,
+    poll_interval: float = 30.0,
+) -> Dict[str, str]:
+    """Submit several prompts as a single OpenAI Batch API job.
+
+    The Batch API trades turnaround time (up to 24 hours, usually much
+    faster) for a 50% discount on token cost and a separate rate-limit
+    pool, which suits latency-tolerant or bulk usage. Prompts already
+    present in the on-disk cache are answered locally and excluded from
+    the submitted batch.
+
+    Args:
+        prompts: Mapping of a caller-chosen id to the prompt text; the ids
+            are used as the batch ``custom_id`` and key the returned dict.
+        api_key: Optional OpenAI API key.
+        model: The OpenAI model name (default: :data:`DEFAULT_MODEL`).
+        use_cache: Whether to consult and populate the on-disk cache.
+        poll_interval: Seconds to sleep between batch status polls.
+
+    Returns:
+        Mapping of each prompt id to the assistant's reply.
+
+    Raises:
+        RuntimeError: If the OpenAI API is unavailable, the batch fails,
+            or the output is missing replies for some prompts.
+    """
+    results: Dict[str, str] = {}
+    pending: Dict[str, str] = {}
+    for custom_id, prompt in prompts.items():
+        if use_cache:
+            cached = _cache_get(_cache_key(prompt, model))
+            if cached is not None:
+                results[custom_id] = cached
+                continue
+        pending[custom_id] = prompt
+    if not pending:
+        return results
+    client = _get_client(api_key)
+    lines = [
+        json.dumps(
+            {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "messages": [
+                        _SYSTEM_MSG,
+                        {"role": "user", "content": prompt},
+                    ],
+                    "temperature": _TEMPERATURE,
+                },
+            }
+        )
+        for custom_id, prompt in pending.items()
+    ]
+    try:
+        input_file = client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+        if batch.status != "completed":
+            raise RuntimeError(f"OpenAI batch {batch.id} finished with status {batch.status!r}.")
+        raw = client.files.content(batch.output_file_id).text
+    except RuntimeError:
+        raise
+    except Exception as exc:  # Catch broad exceptions to surface them nicely
+        raise RuntimeError(f"Failed to call OpenAI Batch API: {exc}") from exc
+    for line in raw.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        custom_id = record["custom_id"]
+        try:
+            content = record["response"]["body"]["choices"][0]["message"]["content"].strip()
+        except (KeyError, IndexError, TypeError) as exc:
+            raise RuntimeError(f"Unexpected batch output for {custom_id!r}: {exc}") from exc
+        results[custom_id] = content
+        if use_cache:
+            _cache_put(_cache_key(pending[custom_id], model), content)
+    missing = set(prompts) - set(results)
+    if missing:
+        raise RuntimeError(f"Batch output is missing replies for: {', '.join(sorted(missing))}.")
+    return results
+
+
+# The four prompt bodies are compiled into string.Template objects once at
+# import time, so serving many ideas only pays a cheap substitution per call
+# instead of re-concatenating each ~200-token prompt.
+_MARKET_ANALYSIS_TPL = string.Template(
+    "You are assisting a founder in understanding their market. "
+    "Given the business idea below, perform a concise market analysis. "
+    "Your analysis should cover:\n"
+    "- Demand: describe who the customers are and their pain points.\n"
+    "- Market size: estimate the addressable market size and growth.\n"
+    "- Economic indicators: mention relevant economic factors (e.g. disposable income, technology adoption).\n"
+    "- Location and saturation: note any geographic considerations and whether the market is crowded.\n"
+    "- Pricing considerations: discuss typical pricing strategies in this space.\n"
+    "- Competitor analysis: identify a few key competitors, their strengths and weaknesses, opportunities, and barriers to entry.\n\n"
+    "Business idea: $idea\n\n"
+    "Respond in a professional tone with headings for each section."
+)
+
+
+def _market_analysis_prompt(idea: str) -> str:
+    """Render the market analysis prompt for the given business idea."""
+    return _MARKET_ANALYSIS_TPL.substitute(idea=idea)
+
+
+def generate_market_analysis(
+    idea: str,
+    *,
+    api_key: str | None = None,
+    model: str | None = None,
+    use_cache: bool = True,
+    sink: Callable[[str], None] | None = None,
+) -> str:
     """Generate a market analysis for the given business idea.
 
     The prompt instructs the model to perform market research, including
@@ -100,27 +519,66 @@ def generate_market_analysis(idea: str, *, api_key: str | None = None) -> str:
     Args:
         idea: A short description of the startup concept.
         api_key: Optional OpenAI API key.
+        model: Optional model override (default: :data:`DEFAULT_MODEL`).
+        use_cache: Whether to consult and populate the on-disk cache.
+        sink: Optional callable receiving text incrementally as it streams.
 
     Returns:
         A string containing the market analysis.
     """
-    prompt = (
-        "You are assisting a founder in understanding their market. "
-        "Given the business idea below, perform a concise market analysis. "
-        "Your analysis should cover:\n"
-        "- Demand: describe who the customers are and their pain points.\n"
-        "- Market size: estimate the addressable market size and growth.\n"
-        "- Economic indicators: mention relevant economic factors (e.g. disposable income, technology adoption).\n"
-        "- Location and saturation: note any geographic considerations and whether the market is crowded.\n"
-        "- Pricing considerations: discuss typical pricing strategies in this space.\n"
-        "- Competitor analysis: identify a few key competitors, their strengths and weaknesses, opportunities, and barriers to entry.\n\n"
-        f"Business idea: {idea}\n\n"
-        "Respond in a professional tone with headings for each section."
+    return _chat_completion(
+        _market_analysis_prompt(idea),
+        api_key=api_key,
+        model=model or DEFAULT_MODEL,
+        use_cache=use_cache,
+        sink=sink,
     )
-    return _chat_completion(prompt, api_key=api_key)
 
 
-def generate_pricing_tiers(idea: str, *, api_key: str | None = None) -> str:
+async def agenerate_market_analysis(
+    idea: str,
+    *,
+    api_key: str | None = None,
+    model: str | None = None,
+    use_cache: bool = True,
+    sink: Callable[[str], None] | None = None,
+) -> str:
+    """Async variant of :func:`generate_market_analysis`."""
+    return await _achat_completion(
+        _market_analysis_prompt(idea),
+        api_key=api_key,
+        model=model or DEFAULT_MODEL,
+        use_cache=use_cache,
+        sink=sink,
+    )
+
+
+_PRICING_TIERS_TPL = string.Template(
+    "You are a pricing strategist. Propose a tiered pricing structure for "
+    "the following business idea. Provide at least three tiers (e.g. Basic, "
+    "Pro, Premium), with a clear name, monthly price in USD, and the key "
+    "features or usage limits each tier includes. Consider cost analysis, "
+    "market research for price sensitivities, segmentation, and value "
+    "proposition for each customer group. Highlight how each tier adds "
+    "additional value compared with the lower tier.\n\n"
+    "Business idea: $idea\n\n"
+    "Present your answer in a bullet list where each tier starts with the tier name and price, followed by a colon and its features."
+)
+
+
+def _pricing_tiers_prompt(idea: str) -> str:
+    """Render the pricing tiers prompt for the given business idea."""
+    return _PRICING_TIERS_TPL.substitute(idea=idea)
+
+
+def generate_pricing_tiers(
+    idea: str,
+    *,
+    api_key: str | None = None,
+    model: str | None = None,
+    use_cache: bool = True,
+    sink: Callable[[str], None] | None = None,
+) -> str:
     """Generate a tiered pricing model for the given business idea.
 
     The prompt instructs the model to propose at least three pricing tiers. It
@@ -131,25 +589,64 @@ def generate_pricing_tiers(idea: str, *, api_key: str | None = None) -> str:
     Args:
         idea: A short description of the startup concept.
         api_key: Optional OpenAI API key.
+        model: Optional model override (default: :data:`DEFAULT_MODEL`).
+        use_cache: Whether to consult and populate the on-disk cache.
+        sink: Optional callable receiving text incrementally as it streams.
 
     Returns:
         A string describing the pricing tiers.
     """
-    prompt = (
-        "You are a pricing strategist. Propose a tiered pricing structure for "
-        "the following business idea. Provide at least three tiers (e.g. Basic, "
-        "Pro, Premium), with a clear name, monthly price in USD, and the key "
-        "features or usage limits each tier includes. Consider cost analysis, "
-        "market research for price sensitivities, segmentation, and value "
-        "proposition for each customer group. Highlight how each tier adds "
-        "additional value compared with the lower tier.\n\n"
-        f"Business idea: {idea}\n\n"
-        "Present your answer in a bullet list where each tier starts with the tier name and price, followed by a colon and its features."
+    return _chat_completion(
+        _pricing_tiers_prompt(idea),
+        api_key=api_key,
+        model=model or DEFAULT_MODEL,
+        use_cache=use_cache,
+        sink=sink,
+    )
+
+
+async def agenerate_pricing_tiers(
+    idea: str,
+    *,
+    api_key: str | None = None,
+    model: str | None = None,
+    use_cache: bool = True,
+    sink: Callable[[str], None] | None = None,
+) -> str:
+    """Async variant of :func:`generate_pricing_tiers`."""
+    return await _achat_completion(
+        _pricing_tiers_prompt(idea),
+        api_key=api_key,
+        model=model or DEFAULT_MODEL,
+        use_cache=use_cache,
+        sink=sink,
     )
-    return _chat_completion(prompt, api_key=api_key)
 
 
-def generate_landing_page_copy(idea: str, *, api_key: str | None = None) -> str:
+_LANDING_PAGE_TPL = string.Template(
+    "You are a marketing copywriter. Write concise and persuasive landing page "
+    "copy for the business idea below. Include:\n"
+    "- A bold headline summarising the core value proposition.\n"
+    "- A short paragraph describing the product or service and its benefits.\n"
+    "- A clear call to action encouraging visitors to sign up or learn more.\n\n"
+    "Business idea: $idea\n\n"
+    "Use an enthusiastic yet professional tone."
+)
+
+
+def _landing_page_prompt(idea: str) -> str:
+    """Render the landing page copy prompt for the given business idea."""
+    return _LANDING_PAGE_TPL.substitute(idea=idea)
+
+
+def generate_landing_page_copy(
+    idea: str,
+    *,
+    api_key: str | None = None,
+    model: str | None = None,
+    use_cache: bool = True,
+    sink: Callable[[str], None] | None = None,
+) -> str:
     """Generate landing page copy for the given business idea.
 
     This function asks the model to write a short, engaging piece of copy
@@ -160,52 +657,91 @@ def generate_landing_page_copy(idea: str, *, api_key: str | None = None) -> str:
     Args:
         idea: A short description of the startup concept.
         api_key: Optional OpenAI API key.
+        model: Optional model override (default: :data:`DEFAULT_MODEL`).
+        use_cache: Whether to consult and populate the on-disk cache.
+        sink: Optional callable receiving text incrementally as it streams.
 
     Returns:
         A string containing the landing page copy.
     """
-    prompt = (
-        "You are a marketing copywriter. Write concise and persuasive landing page "
-        "copy for the business idea below. Include:\n"
-        "- A bold headline summarising the core value proposition.\n"
-        "- A short paragraph describing the product or service and its benefits.\n"
-        "- A clear call to action encouraging visitors to sign up or learn more.\n\n"
-        f"Business idea: {idea}\n\n"
-        "Use an enthusiastic yet professional tone."
+    return _chat_completion(
+        _landing_page_prompt(idea),
+        api_key=api_key,
+        model=model or DEFAULT_MODEL,
+        use_cache=use_cache,
+        sink=sink,
     )
-    return _chat_completion(prompt, api_key=api_key)
 
 
-def generate_pitch_deck_outline(idea: str, *, api_key: str | None = None) -> List[Dict[str, str]]:
-    """Generate a pitch deck outline with slide titles and bullet points.
+async def agenerate_landing_page_copy(
+    idea: str,
+    *,
+    api_key: str | None = None,
+    model: str | None = None,
+    use_cache: bool = True,
+    sink: Callable[[str], None] | None = None,
+) -> str:
+    """Async variant of :func:`generate_landing_page_copy`."""
+    return await _achat_completion(
+        _landing_page_prompt(idea),
+        api_key=api_key,
+        model=model or DEFAULT_MODEL,
+        use_cache=use_cache,
+        sink=sink,
+    )
 
-    The prompt requests the standard ten slides of a startup pitch deck. It
-    instructs the model to produce a list of slides, each with a title and a
-    short list of bullet points. The result is parsed into a list of
-    dictionaries with keys ``title`` and ``content``. If parsing fails, the
-    raw response is returned as a single slide.
 
-    Args:
-        idea: A short description of the startup concept.
-        api_key: Optional OpenAI API key.
+_PITCH_DECK_TPL = string.Template(
+    "You are an expert pitch deck designer. Create an outline for a 10‑slide "
+    "pitch deck for the startup idea below. Follow this structure: (1) "
+    "Business Overview, (2) Problem, (3) Solution & Value Proposition, "
+    "(4) Market Size & Analysis, (5) Product & Business Model, (6) Go‑to‑Market "
+    "Strategy, (7) Competitive Analysis, (8) Team, (9) Financials & Traction, "
+    "(10) Ask & Use of Funds. For each slide, provide a title and 3–5 bullet "
+    "points summarising the key messages you would include on that slide.\n\n"
+    "Business idea: $idea\n\n"
+    "Return only a JSON object of the form "
+    '{"slides": [{"title": str, "bullets": [str, ...]}, ...]} '
+    'with exactly 10 items in "slides".'
+)
 
-    Returns:
-        A list of slides, where each slide is a dict with ``title`` and
-        ``content`` (string of bullet points separated by newlines).
+
+def _pitch_deck_prompt(idea: str) -> str:
+    """Render the pitch deck outline prompt for the given business idea."""
+    return _PITCH_DECK_TPL.substitute(idea=idea)
+
+
+_BULLET_SPLIT_RE = re.compile(r"[;\n]+")
+
+
+def _parse_pitch_deck_outline(raw: str) -> List[Dict[str, object]]:
+    """Parse a raw pitch deck response into a list of slide dicts.
+
+    Each slide is ``{"title": str, "bullets": [str, ...]}`` so consumers
+    iterate a pre-tokenised bullet list instead of re-splitting a joined
+    string. The JSON shape ``{"slides": [{"title": ..., "bullets":
+    [...]}]}`` is tried first; if the model ignored the instruction, the
+    legacy numbered-line format (``"1. Title: point1; point2"``) is
+    parsed instead, and as a last resort the raw text becomes a single
+    slide.
     """
-    prompt = (
-        "You are an expert pitch deck designer. Create an outline for a 10‑slide "
-        "pitch deck for the startup idea below. Follow this structure: (1) "
-        "Business Overview, (2) Problem, (3) Solution & Value Proposition, "
-        "(4) Market Size & Analysis, (5) Product & Business Model, (6) Go‑to‑Market "
-        "Strategy, (7) Competitive Analysis, (8) Team, (9) Financials & Traction, "
-        "(10) Ask & Use of Funds. For each slide, provide a title and 3–5 bullet "
-        "points summarising the key messages you would include on that slide.\n\n"
-        f"Business idea: {idea}\n\n"
-        "Respond in a structured format. Use numbered slides followed by the title and its bullet points."
-    )
-    raw = _chat_completion(prompt, api_key=api_key)
-    slides: List[Dict[str, str]] = []
+    text = raw.strip()
+    if text.startswith("```"):
+        # Strip Markdown code fences some models wrap around JSON output.
+        text = text.strip("`")
+        if text.startswith("json"):
+            text = text[4:]
+    try:
+        data = json.loads(text)
+        slides = [
+            {"title": str(item["title"]), "bullets": [str(b) for b in item["bullets"]]}
+            for item in data["slides"]
+        ]
+        if slides:
+            return slides
+    except (ValueError, KeyError, TypeError):
+        pass
+    slides: List[Dict[str, object]] = []
     # Simple parser to interpret numbered lists into slide dicts
     try:
         for line in raw.splitlines():
@@ -216,15 +752,69 @@ def generate_pitch_deck_outline(idea: str, *, api_key: str | None = None) -> Lis
             if "." in line:
                 number, rest = line.split(".", 1)
                 rest = rest.strip()
-                # Further split on ':' to separate title and content
+                # Further split on ':' to separate title and bullets
                 if ":" in rest:
                     title, content = rest.split(":", 1)
                     title = title.strip()
                     content = content.strip().lstrip("- ")
-                    slides.append({"title": title, "content": content})
+                    bullets = [b for b in map(str.strip, _BULLET_SPLIT_RE.split(content)) if b]
+                    slides.append({"title": title, "bullets": bullets})
         # If we didn't parse anything, fall back to returning raw content
         if not slides:
-            slides.append({"title": "Pitch Deck", "content": raw})
+            slides.append({"title": "Pitch Deck", "bullets": [l for l in raw.splitlines() if l.strip()]})
     except Exception:
-        slides = [{"title": "Pitch Deck", "content": raw}]
-    return slides
\ No newline at end of file
+        slides = [{"title": "Pitch Deck", "bullets": [l for l in raw.splitlines() if l.strip()]}]
+    return slides
+
+
+def generate_pitch_deck_outline(
+    idea: str,
+    *,
+    api_key: str | None = None,
+    model: str | None = None,
+    use_cache: bool = True,
+) -> List[Dict[str, object]]:
+    """Generate a pitch deck outline with slide titles and bullet points.
+
+    The prompt requests the standard ten slides of a startup pitch deck. It
+    instructs the model to produce a list of slides, each with a title and a
+    short list of bullet points. The result is parsed into a list of
+    dictionaries with keys ``title`` and ``bullets``. If parsing fails, the
+    raw response is returned as a single slide.
+
+    Args:
+        idea: A short description of the startup concept.
+        api_key: Optional OpenAI API key.
+        model: Optional model override (default: :data:`DEFAULT_MODEL`).
+        use_cache: Whether to consult and populate the on-disk cache.
+
+    Returns:
+        A list of slides, where each slide is a dict with ``title`` and
+        ``bullets`` (a list of bullet point strings).
+    """
+    raw = _chat_completion(
+        _pitch_deck_prompt(idea),
+        api_key=api_key,
+        model=model or DEFAULT_MODEL,
+        use_cache=use_cache,
+        response_format={"type": "json_object"},
+    )
+    return _parse_pitch_deck_outline(raw)
+
+
+async def agenerate_pitch_deck_outline(
+    idea: str,
+    *,
+    api_key: str | None = None,
+    model: str | None = None,
+    use_cache: bool = True,
+) -> List[Dict[str, object]]:
+    """Async variant of :func:`generate_pitch_deck_outline`."""
+    raw = await _achat_completion(
+        _pitch_deck_prompt(idea),
+        api_key=api_key,
+        model=model or DEFAULT_MODEL,
+        use_cache=use_cache,
+        response_format={"type": "json_object"},
+    )
+    return _parse_pitch_deck_outline(raw)
\ No newline at end of file
@@ -3,8 +3,9 @@
 This module provides a single function, ``create_pitch_deck``, which
 takes a list of slide dictionaries (as produced by
 ``generator.generate_pitch_deck_outline``) and writes a PowerPoint file
-to disk. Each slide contains a title and a body consisting of bullet
-points separated by newlines.
+to disk. Each slide contains a title and a list of bullet points; the
+older ``content`` form (bullet points joined by newlines or semicolons)
+is still accepted.
 
 The function uses the default slide layouts of python‑pptx: the
 first slide (layout 0) is a title slide, while subsequent slides use
@@ -14,18 +15,51 @@ placeholder.
 
 from __future__ import annotations
 
+import functools
+import io
+import re
+from pathlib import Path
 from typing import List, Dict
+
+import pptx
 from pptx import Presentation
 from pptx.util import Inches, Pt  # type: ignore
 
+# Bullet separator, compiled once: semicolons are common in language model
+# responses alongside newlines.
+_SPLIT_RE = re.compile(r"[;\n]+")
+
+
+@functools.lru_cache(maxsize=1)
+def _template_bytes() -> bytes:
+    """Read the default .pptx template shipped with python-pptx, once.
+
+    ``Presentation()`` re-reads and unzips the template (parsing dozens of
+    XML parts) on every call; keeping the raw bytes in memory reduces each
+    subsequent deck to a cheap in-memory unzip, which matters when many
+    decks are generated in one process.
+    """
+    return Path(pptx.__file__).parent.joinpath("templates", "default.pptx").read_bytes()
+
+
+def _new_presentation():
+    """Return a fresh ``Presentation`` built from the cached template bytes."""
+    try:
+        return Presentation(io.BytesIO(_template_bytes()))
+    except OSError:
+        # Unusual installs may not expose the template file; fall back to
+        # letting python-pptx locate it itself.
+        return Presentation()
+
 
-def create_pitch_deck(slides: List[Dict[str, str]], output_path: str) -> None:
+def create_pitch_deck(slides: List[Dict[str, object]], output_path: str) -> None:
     """Create a PowerPoint deck from an outline and save it to a file.
 
     Args:
-        slides: A list of dictionaries with keys ``title`` and ``content``.
-            The ``content`` should be a string of bullet points separated by
-            newlines or semicolons.
+        slides: A list of dictionaries with keys ``title`` and ``bullets``
+            (a list of bullet point strings). For backwards compatibility a
+            ``content`` string of bullet points separated by newlines or
+            semicolons is also accepted.
         output_path: The filesystem path where the PPTX file should be
             written. The parent directories must already exist.
 
@@ -35,42 +69,46 @@ def create_pitch_deck(slides: List[Dict[str, str]], output_path: str) -> None:
     if not slides:
         raise ValueError("No slides provided to create_pitch_deck().")
 
-    prs = Presentation()
+    prs = _new_presentation()
+    # Look the two layouts up once rather than indexing per slide
+    title_layout = prs.slide_layouts[0]
+    content_layout = prs.slide_layouts[1]
     for index, slide_data in enumerate(slides):
         title = slide_data.get("title", "")
-        content = slide_data.get("content", "")
         # Decide layout: first slide uses title slide layout
-        if index == 0:
-            slide_layout = prs.slide_layouts[0]
-        else:
-            slide_layout = prs.slide_layouts[1]
+        slide_layout = title_layout if index == 0 else content_layout
         slide = prs.slides.add_slide(slide_layout)
         # Set the title
         if slide.shapes.title:
             slide.shapes.title.text = title
-        # Set the body (content placeholder) if available
-        # The second placeholder is typically the body for layout 1
-        # For the title slide layout 0 there is a subtitle placeholder
-        for shape in slide.placeholders:
-            if shape.is_placeholder and shape.placeholder_format.type == 1:  # Body placeholder
-                text_frame = shape.text_frame
-                # Clear any existing text
-                text_frame.clear()
-                # Split content into lines; separate on semicolons or newlines
-                # Semicolons are common in language model responses
-                lines = [line.strip() for line in content.replace(";", "\n").split("\n") if line.strip()]
-                if not lines:
-                    break
-                # Add the first line as the first bullet point
-                p = text_frame.paragraphs[0]
-                p.text = lines[0]
-                # Add subsequent lines as additional bullet points
-                for line in lines[1:]:
-                    p = text_frame.add_paragraph()
-                    p.text = line
-                # Apply bullet style
-                for paragraph in text_frame.paragraphs:
-                    paragraph.level = 0
-                break
+        # Set the body (content placeholder) if available. On the content
+        # layout the body is always placeholder index 1, so it is addressed
+        # directly instead of scanning slide.placeholders and re-checking
+        # the placeholder type per slide. The title slide keeps its
+        # subtitle empty, as before.
+        if index == 0:
+            continue
+        try:
+            body = slide.placeholders[1]
+        except KeyError:
+            continue
+        text_frame = body.text_frame
+        # Clear any existing text
+        text_frame.clear()
+        lines = slide_data.get("bullets")
+        if lines is None:
+            # Backwards compatibility: split the older joined-string schema
+            content = slide_data.get("content", "")
+            lines = [line for line in map(str.strip, _SPLIT_RE.split(content)) if line]
+        if not lines:
+            continue
+        # Add the first line as the first bullet point; new paragraphs
+        # already default to level 0, so no explicit assignment is needed
+        p = text_frame.paragraphs[0]
+        p.text = lines[0]
+        # Add subsequent lines as additional bullet points
+        for line in lines[1:]:
+            p = text_frame.add_paragraph()
+            p.text = line
     # Save the file
     prs.save(output_path)
\ No newline at end of file
@@ -0,0 +1,315 @@
+"""Semantic similarity cache for complete deliverable sets.
+
+The exact-match response cache in :mod:`generator` only helps when a
+prompt is byte-identical, but ideas phrased slightly differently ("AI
+personal finance coach" vs "AI‑powered finance assistant") produce
+near-identical deliverables and still trigger four fresh completions.
+This module adds a second cache tier keyed on meaning: each generated
+idea is embedded with a cheap embedding model and stored alongside its
+deliverables, and a new idea whose cosine similarity to a stored one
+exceeds a threshold reuses the stored deliverables outright, saving all
+four completion calls.
+
+Entries live under ``~/.cache/startup_cofounder_agent/semantic`` as one
+JSON file per idea. Like the exact-match tier, the cache degrades
+gracefully: any embedding or filesystem failure simply means a miss.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+from typing import Dict, List, Tuple
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None  # NumPy is optional; a pure-Python scan is used without it.
+
+try:
+    from numba import njit, prange  # type: ignore
+except ImportError:
+    njit = None  # Numba is optional; the NumPy matmul path is used without it.
+    prange = range
+
+from . import generator
+
+_EMBEDDING_MODEL = "text-embedding-3-small"
+_SIMILARITY_THRESHOLD = 0.92
+_SEMANTIC_CACHE_DIR = generator._CACHE_DIR / "semantic"
+
+#: A deliverable set: the three text outputs plus the parsed slide outline.
+Deliverables = Dict[str, object]
+
+
+def _embed(idea: str, api_key: str | None = None) -> List[float]:
+    """Embed an idea with the OpenAI embeddings endpoint.
+
+    Args:
+        idea: A short description of the startup concept.
+        api_key: Optional OpenAI API key.
+
+    Returns:
+        The embedding vector.
+
+    Raises:
+        RuntimeError: If the OpenAI API is unavailable or fails.
+    """
+    client = generator._get_client(api_key)
+    try:
+        response = client.embeddings.create(model=_EMBEDDING_MODEL, input=idea)
+        return list(response.data[0].embedding)
+    except Exception as exc:  # Catch broad exceptions to surface them nicely
+        raise RuntimeError(f"Failed to embed idea with OpenAI API: {exc}") from exc
+
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    """Compute the cosine similarity of two equal-length vectors."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(y * y for y in b))
+    if norm_a == 0.0 or norm_b == 0.0:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+def _valid_embedding(embedding: object, dim: int | None) -> bool:
+    """Check that an embedding is a non-empty numeric vector of dimension ``dim``.
+
+    A corrupt file, or an entry written by a different embedding model,
+    would otherwise poison the matrix index and crash every lookup.
+    """
+    if not isinstance(embedding, list) or not embedding:
+        return False
+    if dim is not None and len(embedding) != dim:
+        return False
+    return all(isinstance(value, (int, float)) for value in embedding)
+
+
+def _scan_signature() -> Tuple:
+    """Build a staleness signature of the cache directory from stat() alone.
+
+    The signature is the sorted (name, mtime) pairs of the entry files, so
+    deciding whether anything changed costs a directory listing and one
+    stat per file -- no reads, no JSON parsing.
+    """
+    signature: List[Tuple[str, float]] = []
+    try:
+        for path in _SEMANTIC_CACHE_DIR.glob("*.json"):
+            try:
+                signature.append((path.name, path.stat().st_mtime))
+            except OSError:
+                continue
+    except OSError:
+        return ()
+    return tuple(sorted(signature))
+
+
+# The parsed entries and the signature they were read under; reused across
+# lookups so unchanged entry files are not re-read and re-parsed per query.
+_ENTRIES: List[Dict[str, object]] = []
+_ENTRIES_SIGNATURE: Tuple = ()
+
+
+def _load_entries() -> Tuple[List[Dict[str, object]], Tuple]:
+    """Return all cache entries, re-reading disk only when files changed.
+
+    Entries must carry deliverables and an embedding whose dimension
+    matches the first conforming entry; anything else is ignored so a
+    single corrupt file cannot break lookups.
+
+    Returns:
+        The entries plus the signature of the backing files (names and
+        mtimes), used to decide whether the in-memory index is stale.
+    """
+    global _ENTRIES, _ENTRIES_SIGNATURE
+    signature = _scan_signature()
+    if signature == _ENTRIES_SIGNATURE:
+        return _ENTRIES, _ENTRIES_SIGNATURE
+    entries: List[Dict[str, object]] = []
+    dim: int | None = None
+    for name, _ in signature:
+        try:
+            entry = json.loads((_SEMANTIC_CACHE_DIR / name).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if (
+            isinstance(entry, dict)
+            and "deliverables" in entry
+            and _valid_embedding(entry.get("embedding"), dim)
+        ):
+            dim = len(entry["embedding"])
+            entries.append(entry)
+    _ENTRIES, _ENTRIES_SIGNATURE = entries, signature
+    return entries, signature
+
+
+# Minimum cache size before the JIT kernel beats the plain NumPy matmul;
+# below this the one-off compile and dispatch overhead is not worth it.
+_JIT_MIN_ROWS = 4096
+
+if njit is not None and np is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _top1_jit(matrix, norms, query, query_norm, out):  # pragma: no cover
+        """Fill ``out`` with cosine similarities and return (argmax, max).
+
+        One parallel pass over the rows with a reused output buffer, so
+        large scans avoid the fresh (N,) allocation a NumPy expression
+        would make each query.
+        """
+        n = matrix.shape[0]
+        for i in prange(n):
+            s = 0.0
+            for j in range(matrix.shape[1]):
+                s += matrix[i, j] * query[j]
+            denominator = norms[i] * query_norm
+            out[i] = s / denominator if denominator > 0.0 else 0.0
+        best_index = 0
+        for i in range(1, n):
+            if out[i] > out[best_index]:
+                best_index = i
+        return best_index, out[best_index]
+
+else:
+    _top1_jit = None
+
+
+class _EmbeddingIndex:
+    """In-memory matrix of the cached embeddings for vectorised lookups.
+
+    Scanning the cache entry-by-entry in Python is O(N) interpreter work
+    per query; packing the embeddings into one float32 matrix turns the
+    whole scan into a single BLAS matrix-vector product. The matrix is
+    preallocated and grown by doubling so repeated inserts do not
+    reallocate per entry, and it is only rebuilt when the on-disk entries
+    change.
+    """
+
+    def __init__(self) -> None:
+        self._signature: Tuple = ()
+        self._matrix = None
+        self._norms = None
+        self._sims = None
+        self._count = 0
+
+    def refresh(self, entries: List[Dict[str, object]], signature: Tuple) -> None:
+        """Synchronise the matrix with the given entries if they changed."""
+        if signature == self._signature:
+            return
+        dim = len(entries[0]["embedding"])
+        capacity = 0 if self._matrix is None else self._matrix.shape[0]
+        if capacity < len(entries) or (self._matrix is not None and self._matrix.shape[1] != dim):
+            new_capacity = max(capacity, 64)
+            while new_capacity < len(entries):
+                new_capacity *= 2
+            self._matrix = np.empty((new_capacity, dim), dtype=np.float32)
+            self._norms = np.empty(new_capacity, dtype=np.float32)
+            self._sims = np.empty(new_capacity, dtype=np.float32)
+        for row, entry in enumerate(entries):
+            self._matrix[row] = entry["embedding"]
+        self._count = len(entries)
+        self._norms[: self._count] = np.linalg.norm(self._matrix[: self._count], axis=1)
+        self._signature = signature
+
+    def best(self, query: List[float]) -> Tuple[int, float]:
+        """Return the row index and cosine similarity of the nearest entry."""
+        q = np.asarray(query, dtype=np.float32)
+        q_norm = float(np.linalg.norm(q))
+        if _top1_jit is not None and self._count >= _JIT_MIN_ROWS:
+            index, similarity = _top1_jit(
+                self._matrix[: self._count],
+                self._norms[: self._count],
+                q,
+                q_norm,
+                self._sims[: self._count],
+            )
+            return int(index), float(similarity)
+        denominators = self._norms[: self._count] * q_norm
+        # Guard against zero vectors so the division cannot produce NaN
+        denominators[denominators == 0.0] = 1.0
+        similarities = (self._matrix[: self._count] @ q) / denominators
+        index = int(similarities.argmax())
+        return index, float(similarities[index])
+
+
+_INDEX = _EmbeddingIndex() if np is not None else None
+
+
+def lookup(
+    idea: str,
+    *,
+    api_key: str | None = None,
+    threshold: float = _SIMILARITY_THRESHOLD,
+) -> Deliverables | None:
+    """Return the deliverables of the most similar cached idea, if close enough.
+
+    The idea is embedded and compared against every stored entry by
+    cosine similarity; the nearest neighbour is returned when it clears
+    ``threshold``. Failures (no cache, embedding error) count as misses.
+
+    Args:
+        idea: A short description of the startup concept.
+        api_key: Optional OpenAI API key.
+        threshold: Minimum cosine similarity for a hit.
+
+    Returns:
+        The cached deliverables dict, or ``None`` on a miss.
+    """
+    entries, signature = _load_entries()
+    if not entries:
+        return None
+    try:
+        query = _embed(idea, api_key=api_key)
+    except RuntimeError:
+        return None
+    if len(query) != len(entries[0]["embedding"]):
+        # A different embedding model produced the cache; treat as a miss.
+        return None
+    best_entry: Dict[str, object] | None = None
+    best_similarity = -1.0
+    if _INDEX is not None:
+        try:
+            _INDEX.refresh(entries, signature)
+            best_index, best_similarity = _INDEX.best(query)
+            best_entry = entries[best_index]
+        except Exception:
+            # The index is an optimisation; never let it break a lookup.
+            best_entry = None
+            best_similarity = -1.0
+    if best_entry is None:
+        for entry in entries:
+            similarity = _cosine_similarity(query, entry["embedding"])
+            if similarity > best_similarity:
+                best_similarity = similarity
+                best_entry = entry
+    if best_entry is not None and best_similarity >= threshold:
+        return best_entry["deliverables"]
+    return None
+
+
+def store(idea: str, deliverables: Deliverables, *, api_key: str | None = None) -> None:
+    """Store an idea's deliverables under its embedding.
+
+    Like the exact-match cache, failures are swallowed: a read-only home
+    directory or an embedding error should never break generation.
+
+    Args:
+        idea: A short description of the startup concept.
+        deliverables: The generated outputs to reuse on future hits.
+        api_key: Optional OpenAI API key.
+    """
+    try:
+        embedding = _embed(idea, api_key=api_key)
+    except RuntimeError:
+        return
+    name = hashlib.sha256(idea.encode("utf-8")).hexdigest()
+    try:
+        _SEMANTIC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (_SEMANTIC_CACHE_DIR / f"{name}.json").write_text(
+            json.dumps({"idea": idea, "embedding": embedding, "deliverables": deliverables}),
+            encoding="utf-8",
+        )
+    except OSError:
+        pass